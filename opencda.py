@@ -26,6 +26,9 @@ def arg_parse():
                              ' as well as the corresponding yaml file in opencda/scenario_testing/config_yaml.')
     parser.add_argument("--record", action='store_true',
                         help='whether to record and save the simulation process to .log file')
+    parser.add_argument("--no_spectator", dest='show_spectator', action='store_false',
+                        help='whether to skip moving the spectator camera along with the CAVs every '
+                             'simulation step. Useful for headless runs.')
     parser.add_argument("--apply_ml",
                         action='store_true',
                         help='whether ml/dl framework such as sklearn/pytorch is needed in the testing. '
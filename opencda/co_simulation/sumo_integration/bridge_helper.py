@@ -18,9 +18,30 @@ import random
 import os
 
 import carla  # pylint: disable=import-error
-import traci  # pylint: disable=import-error
 
-from opencda.co_simulation.sumo_integration.sumo_simulation import SumoSignalState, SumoVehSignal
+from opencda.co_simulation.sumo_integration.sumo_simulation import SumoSignalState, SumoVehSignal, \
+    traci
+
+# ==================================================================================================
+# -- traffic light states --------------------------------------------------------------------------
+# ==================================================================================================
+
+_SUMO_TO_CARLA_TL_STATE = {
+    SumoSignalState.RED: carla.TrafficLightState.Red,
+    SumoSignalState.RED_YELLOW: carla.TrafficLightState.Red,
+    SumoSignalState.YELLOW: carla.TrafficLightState.Yellow,
+    SumoSignalState.GREEN: carla.TrafficLightState.Green,
+    SumoSignalState.GREEN_WITHOUT_PRIORITY: carla.TrafficLightState.Green,
+    SumoSignalState.OFF: carla.TrafficLightState.Off,
+    # SumoSignalState.GREEN_RIGHT_TURN and SumoSignalState.OFF_BLINKING default to Unknown.
+}
+
+_CARLA_TO_SUMO_TL_STATE = {
+    carla.TrafficLightState.Red: SumoSignalState.RED,
+    carla.TrafficLightState.Yellow: SumoSignalState.YELLOW,
+    carla.TrafficLightState.Green: SumoSignalState.GREEN,
+    # carla.TrafficLightState.Off and carla.TrafficLightState.Unknown default to Off.
+}
 
 # ==================================================================================================
 # -- Bridge helper (SUMO <=> CARLA) ----------------------------------------------------------------
@@ -336,35 +357,11 @@ class BridgeHelper(object):
         """
         Returns carla traffic light state based on sumo traffic light state.
         """
-        if sumo_tl_state == SumoSignalState.RED or sumo_tl_state == SumoSignalState.RED_YELLOW:
-            return carla.TrafficLightState.Red
-
-        elif sumo_tl_state == SumoSignalState.YELLOW:
-            return carla.TrafficLightState.Yellow
-
-        elif sumo_tl_state == SumoSignalState.GREEN or \
-             sumo_tl_state == SumoSignalState.GREEN_WITHOUT_PRIORITY:
-            return carla.TrafficLightState.Green
-
-        elif sumo_tl_state == SumoSignalState.OFF:
-            return carla.TrafficLightState.Off
-
-        else:  # SumoSignalState.GREEN_RIGHT_TURN and SumoSignalState.OFF_BLINKING
-            return carla.TrafficLightState.Unknown
+        return _SUMO_TO_CARLA_TL_STATE.get(sumo_tl_state, carla.TrafficLightState.Unknown)
 
     @staticmethod
     def get_sumo_traffic_light_state(carla_tl_state):
         """
         Returns sumo traffic light state based on carla traffic light state.
         """
-        if carla_tl_state == carla.TrafficLightState.Red:
-            return SumoSignalState.RED
-
-        elif carla_tl_state == carla.TrafficLightState.Yellow:
-            return SumoSignalState.YELLOW
-
-        elif carla_tl_state == carla.TrafficLightState.Green:
-            return SumoSignalState.GREEN
-
-        else:  # carla.TrafficLightState.Off and carla.TrafficLightState.Unknown
-            return SumoSignalState.OFF
+        return _CARLA_TO_SUMO_TL_STATE.get(carla_tl_state, SumoSignalState.OFF)
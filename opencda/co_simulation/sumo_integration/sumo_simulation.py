@@ -14,11 +14,26 @@
 import collections
 import enum
 import logging
+import operator
 import os
 
 import carla  # pylint: disable=import-error
 import sumolib  # pylint: disable=import-error
-import traci  # pylint: disable=import-error
+
+# libsumo runs sumo in-process, avoiding the socket round-trip of every traci call. It only supports
+# a single client and no sumo-gui, so it is used only when requested through LIBSUMO_AS_TRACI (the
+# same switch used by the sumo tools) and available. Both modules expose the same api.
+if 'LIBSUMO_AS_TRACI' in os.environ:
+    try:
+        import libsumo as traci  # pylint: disable=import-error
+        LIBSUMO = True
+    except ImportError:
+        logging.warning('LIBSUMO_AS_TRACI is set but libsumo is not available, using traci')
+        import traci  # pylint: disable=import-error
+        LIBSUMO = False
+else:
+    import traci  # pylint: disable=import-error
+    LIBSUMO = False
 
 from opencda.co_simulation.sumo_integration.constants import INVALID_ACTOR_ID
 
@@ -99,8 +114,19 @@ class SumoActorClass(enum.Enum):
     CUSTOM2 = "custom2"
 
 
+# Value to member lookup, avoids going through the enum constructor for every actor.
+_SUMO_ACTOR_CLASSES = {vclass.value: vclass for vclass in SumoActorClass}
+
+
 SumoActor = collections.namedtuple('SumoActor', 'type_id vclass transform signals extent color')
 
+# Fetches all the subscribed variables needed to build a SumoActor in a single call.
+_get_actor_results = operator.itemgetter(
+    traci.constants.VAR_TYPE, traci.constants.VAR_VEHICLECLASS, traci.constants.VAR_COLOR,
+    traci.constants.VAR_LENGTH, traci.constants.VAR_WIDTH, traci.constants.VAR_HEIGHT,
+    traci.constants.VAR_POSITION3D, traci.constants.VAR_ANGLE, traci.constants.VAR_SLOPE,
+    traci.constants.VAR_SIGNALS)
+
 # ==================================================================================================
 # -- sumo traffic lights ---------------------------------------------------------------------------
 # ==================================================================================================
@@ -114,17 +140,18 @@ class SumoTLLogic(object):
         self.tlid = tlid
         self.states = states
 
-        self._landmark2link = {}
+        landmark2link = collections.defaultdict(list)
         self._link2landmark = {}
         for link_index, landmark_id in parameters.items():
             # Link index information is added in the parameter as 'linkSignalID:x'
             link_index = int(link_index.split(':')[1])
 
-            if landmark_id not in self._landmark2link:
-                self._landmark2link[landmark_id] = []
-            self._landmark2link[landmark_id].append((tlid, link_index))
+            landmark2link[landmark_id].append((tlid, link_index))
             self._link2landmark[(tlid, link_index)] = landmark_id
 
+        # Plain dict once built, so later lookups cannot insert empty entries by mistake.
+        self._landmark2link = dict(landmark2link)
+
     def get_number_signals(self):
         """
         Returns number of internal signals of the traffic light.
@@ -178,6 +205,11 @@ class SumoTLManager(object):
             self._current_program[tlid] = traci.trafficlight.getProgram(tlid)
             self._current_phase[tlid] = traci.trafficlight.getPhase(tlid)
 
+        # The signals of a landmark only depend on the current programs. set_state resolves them
+        # each time a landmark is synchronized, so they are cached (as frozensets, to be safely
+        # shared with callers) until a program changes.
+        self._associated_signals_cache = {}  # {landmark_id: frozenset of (tlid, link_index)}
+
         self._off = False
 
     @staticmethod
@@ -223,10 +255,18 @@ class SumoTLManager(object):
         Returns all the signals associated with the given landmark.
             :returns list: [(tlid, link_index), (tlid, link_index), ...]
         """
-        signals = set()
-        for tlid, program_id in self._current_program.items():
-            signals.update(self._tls[tlid][program_id].get_associated_signals(landmark_id))
-        return signals
+        if landmark_id not in self._associated_signals_cache:
+            signals = set()
+            for tlid, program_id in self._current_program.items():
+                signals.update(self._tls[tlid][program_id].get_associated_signals(landmark_id))
+            self._associated_signals_cache[landmark_id] = frozenset(signals)
+        return self._associated_signals_cache[landmark_id]
+
+    def _invalidate_cache(self):
+        """
+        Drops the cached landmark signals after a program change.
+        """
+        self._associated_signals_cache.clear()
 
     def get_state(self, landmark_id):
         """
@@ -261,8 +301,11 @@ class SumoTLManager(object):
         """
         Switch off all traffic lights.
         """
-        for tlid, link_index in self.get_all_signals():
-            traci.trafficlight.setLinkState(tlid, link_index, SumoSignalState.OFF)
+        # The whole state string of each traffic light is set at once instead of link by link.
+        for tlid, program_id in self._current_program.items():
+            num_signals = self._tls[tlid][program_id].get_number_signals()
+            if num_signals > 0:
+                traci.trafficlight.setRedYellowGreenState(tlid, SumoSignalState.OFF * num_signals)
         self._off = True
 
     def tick(self):
@@ -270,14 +313,15 @@ class SumoTLManager(object):
         Tick to traffic light manager
         """
         if self._off is False:
-            for tl_id in traci.trafficlight.getIDList():
-                results = traci.trafficlight.getSubscriptionResults(tl_id)
+            for tl_id, results in traci.trafficlight.getAllSubscriptionResults().items():
                 current_program = results[traci.constants.TL_CURRENT_PROGRAM]
-                current_phase = results[traci.constants.TL_CURRENT_PHASE]
+                if current_program == 'online':
+                    continue
 
-                if current_program != 'online':
+                if current_program != self._current_program[tl_id]:
                     self._current_program[tl_id] = current_program
-                    self._current_phase[tl_id] = current_phase
+                    self._invalidate_cache()
+                self._current_phase[tl_id] = results[traci.constants.TL_CURRENT_PHASE]
 
 
 # ==================================================================================================
@@ -293,12 +337,18 @@ def _get_sumo_net(cfg_file):
     """
     cfg_file = os.path.join(os.getcwd(), cfg_file)
 
-    tree = ET.parse(cfg_file)
-    tag = tree.find('//net-file')
-    if tag is None:
+    # The net file is declared at the top of the configuration, so parsing stops at the first hit
+    # instead of building and searching the whole tree.
+    net_file = None
+    with open(cfg_file, 'rb') as f:
+        for _, tag in ET.iterparse(f, events=('start',), tag='net-file'):
+            net_file = tag.get('value')
+            break
+
+    if net_file is None:
         return None
 
-    net_file = os.path.join(os.path.dirname(cfg_file), tag.get('value'))
+    net_file = os.path.join(os.path.dirname(cfg_file), net_file)
     logging.debug('Reading net file: %s', net_file)
 
     sumo_net = sumolib.net.readNet(net_file)
@@ -314,10 +364,17 @@ class SumoSimulation(object):
         else:
             sumo_binary = sumolib.checkBinary('sumo')
 
+        if LIBSUMO and (host is not None or port is not None):
+            raise RuntimeError('libsumo does not support connecting to a running sumo server, '
+                               'unset LIBSUMO_AS_TRACI to use traci instead')
+
         if host is None or port is None:
             logging.info('Starting new sumo server...')
             if sumo_gui is True:
-                logging.info('Remember to press the play button to start the simulation')
+                if LIBSUMO:
+                    logging.warning('sumo-gui is not supported by libsumo, running without gui')
+                else:
+                    logging.info('Remember to press the play button to start the simulation')
 
             traci.start([sumo_binary,
                 '--configuration-file', cfg_file,
@@ -329,7 +386,9 @@ class SumoSimulation(object):
             logging.info('Connection to sumo server. Host: %s Port: %s', host, port)
             traci.init(host=host, port=port)
 
-        traci.setOrder(client_order)
+        # Client order only matters for multi-client traci connections.
+        if not LIBSUMO:
+            traci.setOrder(client_order)
 
         # Retrieving net from configuration file.
         self.net = _get_sumo_net(cfg_file)
@@ -340,10 +399,18 @@ class SumoSimulation(object):
         # Variable to asign an id to new added actors.
         self._sequential_id = 0
 
+        # Parsed actor colors, key: carla color attribute (i.e., 'r,g,b').
+        self._colors = {}
+
         # Structures to keep track of the spawned and destroyed vehicles at each time step.
         self.spawned_actors = set()
         self.destroyed_actors = set()
 
+        # Departed and arrived vehicles are retrieved each step with a single subscription.
+        traci.simulation.subscribe([
+            traci.constants.VAR_DEPARTED_VEHICLES_IDS, traci.constants.VAR_ARRIVED_VEHICLES_IDS
+        ])
+
         # Traffic light manager.
         self.traffic_light_manager = SumoTLManager()
 
@@ -393,22 +460,31 @@ class SumoSimulation(object):
         """
         Accessor for sumo actor.
         """
-        results = traci.vehicle.getSubscriptionResults(actor_id)
+        return SumoSimulation._build_actor(traci.vehicle.getSubscriptionResults(actor_id))
 
-        type_id = results[traci.constants.VAR_TYPE]
-        vclass = SumoActorClass(results[traci.constants.VAR_VEHICLECLASS])
-        color = results[traci.constants.VAR_COLOR]
+    @staticmethod
+    def get_all_actors(actor_ids):
+        """
+        Accessor for the given subscribed sumo actors, retrieved with a single traci call.
+            :param actor_ids: ids of the actors to be built.
+            :returns dict: {actor_id: SumoActor}
+        """
+        results = traci.vehicle.getAllSubscriptionResults()
+        return {
+            actor_id: SumoSimulation._build_actor(results[actor_id]) for actor_id in actor_ids
+        }
 
-        length = results[traci.constants.VAR_LENGTH]
-        width = results[traci.constants.VAR_WIDTH]
-        height = results[traci.constants.VAR_HEIGHT]
+    @staticmethod
+    def _build_actor(results):
+        """
+        Builds a sumo actor from its subscription results.
+        """
+        (type_id, vclass, color, length, width, height, location, angle, slope,
+         signals) = _get_actor_results(results)
+        vclass = _SUMO_ACTOR_CLASSES[vclass]
 
-        location = list(results[traci.constants.VAR_POSITION3D])
-        rotation = [results[traci.constants.VAR_SLOPE], results[traci.constants.VAR_ANGLE], 0.0]
         transform = carla.Transform(carla.Location(location[0], location[1], location[2]),
-                                    carla.Rotation(rotation[0], rotation[1], rotation[2]))
-
-        signals = results[traci.constants.VAR_SIGNALS]
+                                    carla.Rotation(slope, angle, 0.0))
         extent = carla.Vector3D(length / 2.0, width / 2.0, height / 2.0)
 
         return SumoActor(type_id, vclass, transform, signals, extent, color)
@@ -424,13 +500,14 @@ class SumoSimulation(object):
         actor_id = 'carla' + str(self._sequential_id)
         try:
             traci.vehicle.add(actor_id, 'carla_route', typeID=type_id)
-        except traci.exceptions.TraCIException as error:
+        except traci.TraCIException as error:
             logging.error('Spawn sumo actor failed: %s', error)
             return INVALID_ACTOR_ID
 
         if color is not None:
-            color = color.split(',')
-            traci.vehicle.setColor(actor_id, color)
+            if color not in self._colors:
+                self._colors[color] = tuple(int(channel) for channel in color.split(','))
+            traci.vehicle.setColor(actor_id, self._colors[color])
 
         self._sequential_id += 1
 
@@ -466,10 +543,9 @@ class SumoSimulation(object):
             :param signals: new vehicle signals.
             :return: True if successfully updated. Otherwise, False.
         """
-        loc_x, loc_y = transform.location.x, transform.location.y
-        yaw = transform.rotation.yaw
-
-        traci.vehicle.moveToXY(vehicle_id, "", 0, loc_x, loc_y, angle=yaw, keepRoute=2)
+        location = transform.location
+        traci.vehicle.moveToXY(vehicle_id, "", 0, location.x, location.y,
+                               angle=transform.rotation.yaw, keepRoute=2)
         if signals is not None:
             traci.vehicle.setSignals(vehicle_id, signals)
         return True
@@ -492,8 +568,9 @@ class SumoSimulation(object):
         self.traffic_light_manager.tick()
 
         # Update data structures for the current frame.
-        self.spawned_actors = set(traci.simulation.getDepartedIDList())
-        self.destroyed_actors = set(traci.simulation.getArrivedIDList())
+        results = traci.simulation.getSubscriptionResults()
+        self.spawned_actors = set(results[traci.constants.VAR_DEPARTED_VEHICLES_IDS])
+        self.destroyed_actors = set(results[traci.constants.VAR_ARRIVED_VEHICLES_IDS])
 
     @staticmethod
     def close():
@@ -17,6 +17,14 @@ from opencda.scenario_testing.evaluations.evaluate_manager import \
     EvaluationManager
 from opencda.scenario_testing.utils.yaml_utils import add_current_time
 
+# map and sumo config paths, resolved once at import time
+_CURRENT_PATH = os.path.dirname(os.path.realpath(__file__))
+_XODR_PATH = os.path.join(_CURRENT_PATH,
+                          '../assets/2lane_freeway_simplified/'
+                          '2lane_freeway_simplified.xodr')
+_SUMO_CFG = os.path.join(_CURRENT_PATH,
+                         '../assets/2lane_freeway_simplified')
+
 
 def run_scenario(opt, scenario_params):
     try:
@@ -25,22 +33,14 @@ def run_scenario(opt, scenario_params):
         # create CAV world
         cav_world = CavWorld(opt.apply_ml)
 
-        # sumo conifg file path
-        current_path = os.path.dirname(os.path.realpath(__file__))
-        xodr_path = os.path.join(current_path,
-                                 '../assets/2lane_freeway_simplified/'
-                                 '2lane_freeway_simplified.xodr')
-        sumo_cfg = os.path.join(current_path,
-                                '../assets/2lane_freeway_simplified')
-
         # create co-simulation scenario manager
         scenario_manager = \
             sim_api.CoScenarioManager(scenario_params,
                                       opt.apply_ml,
                                       opt.version,
-                                      xodr_path=xodr_path,
+                                      xodr_path=_XODR_PATH,
                                       cav_world=cav_world,
-                                      sumo_file_parent_path=sumo_cfg)
+                                      sumo_file_parent_path=_SUMO_CFG)
 
         # create platoon members
         platoon_list = \
@@ -60,16 +60,19 @@ def run_scenario(opt, scenario_params):
                               current_time=scenario_params['current_time'])
 
         spectator = scenario_manager.world.get_spectator()
+        show_spectator = getattr(opt, 'show_spectator', True)
         spectator_vehicle = platoon_list[0].vehicle_manager_list[1].vehicle
 
         while True:
             # simulation tick
             scenario_manager.tick()
 
-            transform = spectator_vehicle.get_transform()
-            spectator.set_transform(carla.Transform(transform.location +
-                                                    carla.Location(z=80),
-                                                    carla.Rotation(pitch=-90)))
+            if show_spectator:
+                transform = spectator_vehicle.get_transform()
+                spectator.set_transform(
+                    carla.Transform(transform.location +
+                                    carla.Location(z=80),
+                                    carla.Rotation(pitch=-90)))
 
             for platoon in platoon_list:
                 platoon.update_information()
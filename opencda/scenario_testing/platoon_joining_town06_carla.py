@@ -49,20 +49,22 @@ def run_scenario(opt, scenario_params):
                               current_time=scenario_params['current_time'])
 
         spectator = scenario_manager.world.get_spectator()
+        show_spectator = getattr(opt, 'show_spectator', True)
         spectator_vehicle = single_cav_list[0].vehicle
 
         # run steps
         while True:
             scenario_manager.tick()
-            transform = spectator_vehicle.get_transform()
-            spectator.set_transform(
-                carla.Transform(
-                    transform.location +
-                    carla.Location(
-                        z=80),
-                    carla.Rotation(
-                        pitch=-
-                        90)))
+            if show_spectator:
+                transform = spectator_vehicle.get_transform()
+                spectator.set_transform(
+                    carla.Transform(
+                        transform.location +
+                        carla.Location(
+                            z=80),
+                        carla.Rotation(
+                            pitch=-
+                            90)))
             for platoon in platoon_list:
                 platoon.update_information()
                 platoon.run_step()
@@ -48,6 +48,7 @@ def run_scenario(opt, scenario_params):
                      "only single platoon is allowed.")
 
         spectator = scenario_manager.world.get_spectator()
+        show_spectator = getattr(opt, 'show_spectator', True)
         spectator_vehicle = platoon_list[0].vehicle_manager_list[0].vehicle
 
         eval_manager = \
@@ -71,15 +72,16 @@ def run_scenario(opt, scenario_params):
         # run steps
         while True:
             scenario_manager.tick()
-            transform = spectator_vehicle.get_transform()
-            spectator.set_transform(
-                carla.Transform(
-                    transform.location +
-                    carla.Location(
-                        z=80),
-                    carla.Rotation(
-                        pitch=-
-                        90)))
+            if show_spectator:
+                transform = spectator_vehicle.get_transform()
+                spectator.set_transform(
+                    carla.Transform(
+                        transform.location +
+                        carla.Location(
+                            z=80),
+                        carla.Rotation(
+                            pitch=-
+                            90)))
 
             test_platoon_manager.update_information()
             test_platoon_manager.run_step()
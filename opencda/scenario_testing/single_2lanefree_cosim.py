@@ -18,6 +18,14 @@ from opencda.scenario_testing.evaluations.evaluate_manager import \
     EvaluationManager
 from opencda.scenario_testing.utils.yaml_utils import add_current_time
 
+# map and sumo config paths, resolved once at import time
+_CURRENT_PATH = os.path.dirname(os.path.realpath(__file__))
+_XODR_PATH = os.path.join(_CURRENT_PATH,
+                          '../assets/2lane_freeway_simplified/'
+                          '2lane_freeway_simplified.xodr')
+_SUMO_CFG = os.path.join(_CURRENT_PATH,
+                         '../assets/2lane_freeway_simplified')
+
 
 def run_scenario(opt, scenario_params):
     try:
@@ -26,22 +34,14 @@ def run_scenario(opt, scenario_params):
         # create CAV world
         cav_world = CavWorld(opt.apply_ml)
 
-        # sumo conifg file path
-        current_path = os.path.dirname(os.path.realpath(__file__))
-        xodr_path = os.path.join(current_path,
-                                 '../assets/2lane_freeway_simplified/'
-                                 '2lane_freeway_simplified.xodr')
-        sumo_cfg = os.path.join(current_path,
-                                '../assets/2lane_freeway_simplified')
-
         # create co-simulation scenario manager
         scenario_manager = \
             sim_api.CoScenarioManager(scenario_params,
                                       opt.apply_ml,
                                       opt.version,
-                                      xodr_path=xodr_path,
+                                      xodr_path=_XODR_PATH,
                                       cav_world=cav_world,
-                                      sumo_file_parent_path=sumo_cfg)
+                                      sumo_file_parent_path=_SUMO_CFG)
         single_cav_list = \
             scenario_manager.create_vehicle_manager(application=['single'],
                                                     map_helper=map_api.
@@ -54,20 +54,30 @@ def run_scenario(opt, scenario_params):
                               current_time=scenario_params['current_time'])
 
         spectator = scenario_manager.world.get_spectator()
+        show_spectator = getattr(opt, 'show_spectator', True)
+        # the spectator offset/rotation never change, build them only once
+        spectator_offset = carla.Location(z=50)
+        spectator_rotation = carla.Rotation(pitch=-90)
+        get_cav_transform = single_cav_list[0].vehicle.get_transform
 
         while True:
             # simulation tick
             scenario_manager.tick()
 
-            transform = single_cav_list[0].vehicle.get_transform()
-            spectator.set_transform(carla.Transform(transform.location +
-                                                    carla.Location(z=50),
-                                                    carla.Rotation(pitch=-90)))
+            if show_spectator:
+                transform = get_cav_transform()
+                spectator.set_transform(carla.Transform(transform.location +
+                                                        spectator_offset,
+                                                        spectator_rotation))
 
-            for i, single_cav in enumerate(single_cav_list):
+            # controls of all the CAVs are sent to the server in one batch
+            batch = []
+            for single_cav in single_cav_list:
                 single_cav.update_info()
                 control = single_cav.run_step()
-                single_cav.vehicle.apply_control(control)
+                batch.append(carla.command.ApplyVehicleControl(
+                    single_cav.vehicle.id, control))
+            scenario_manager.client.apply_batch(batch)
 
     finally:
         eval_manager.evaluate()
@@ -13,6 +13,11 @@ from opencda.scenario_testing.evaluations.evaluate_manager import \
     EvaluationManager
 from opencda.scenario_testing.utils.yaml_utils import add_current_time
 
+# map and sumo config paths, resolved once at import time
+_CURRENT_PATH = os.path.dirname(os.path.realpath(__file__))
+_SUMO_CFG = os.path.join(_CURRENT_PATH,
+                         '../assets/Town05')
+
 
 def run_scenario(opt, scenario_params):
     try:
@@ -21,11 +26,6 @@ def run_scenario(opt, scenario_params):
         # create CAV world
         cav_world = CavWorld(opt.apply_ml)
 
-        # sumo conifg file path
-        current_path = os.path.dirname(os.path.realpath(__file__))
-        sumo_cfg = os.path.join(current_path,
-                                '../assets/Town05')
-
         # create co-simulation scenario manager
         scenario_manager = \
             sim_api.CoScenarioManager(scenario_params,
@@ -33,7 +33,7 @@ def run_scenario(opt, scenario_params):
                                       opt.version,
                                       town='Town05',
                                       cav_world=cav_world,
-                                      sumo_file_parent_path=sumo_cfg)
+                                      sumo_file_parent_path=_SUMO_CFG)
         single_cav_list = \
             scenario_manager.create_vehicle_manager(application=['single'],
                                                     map_helper=map_api.
@@ -46,20 +46,30 @@ def run_scenario(opt, scenario_params):
                               current_time=scenario_params['current_time'])
 
         spectator = scenario_manager.world.get_spectator()
+        show_spectator = getattr(opt, 'show_spectator', True)
+        # the spectator offset/rotation never change, build them only once
+        spectator_offset = carla.Location(z=50)
+        spectator_rotation = carla.Rotation(pitch=-90)
+        get_cav_transform = single_cav_list[0].vehicle.get_transform
 
         while True:
             # simulation tick
             scenario_manager.tick()
 
-            transform = single_cav_list[0].vehicle.get_transform()
-            spectator.set_transform(carla.Transform(transform.location +
-                                                    carla.Location(z=50),
-                                                    carla.Rotation(pitch=-90)))
+            if show_spectator:
+                transform = get_cav_transform()
+                spectator.set_transform(carla.Transform(transform.location +
+                                                        spectator_offset,
+                                                        spectator_rotation))
 
-            for i, single_cav in enumerate(single_cav_list):
+            # controls of all the CAVs are sent to the server in one batch
+            batch = []
+            for single_cav in single_cav_list:
                 single_cav.update_info()
                 control = single_cav.run_step()
-                single_cav.vehicle.apply_control(control)
+                batch.append(carla.command.ApplyVehicleControl(
+                    single_cav.vehicle.id, control))
+            scenario_manager.client.apply_batch(batch)
 
     finally:
         eval_manager.evaluate()
@@ -80,6 +80,8 @@ class CoScenarioManager(ScenarioManager):
                 else:
                     logging.warning('Landmark %s is not linked to any '
                                     'traffic light', landmark.id)
+        # last carla traffic light state pushed to sumo, key: landmark id
+        self._tl_states = {}
 
         # sumo side initialization
         base_name = \
@@ -105,6 +107,12 @@ class CoScenarioManager(ScenarioManager):
                                    sumo_client_order)
         # the sumo traffic light should be synchronized with carla
         self.sumo.switch_off_traffic_lights()
+        # landmarks existing on both sides and their carla traffic light.
+        # sumo programs no longer change once switched off, so the pairing
+        # is computed only once instead of every tick.
+        self._common_tls = tuple(
+            (landmark_id, self._tls[landmark_id]) for landmark_id in
+            self.sumo.traffic_light_ids & self.traffic_light_ids)
 
         # Mapped actor ids. All vehicles controlled by sumo is
         # in sumo2carla_ids, all vehicles controlled by carla
@@ -131,7 +139,7 @@ class CoScenarioManager(ScenarioManager):
         self.sumo.tick()
 
         # Spawning new sumo actors in carla (i.e, not controlled by carla).
-        sumo_spawned_actors = self.sumo.spawned_actors - set(
+        sumo_spawned_actors = self.sumo.spawned_actors.difference(
             self.carla2sumo_ids.values())
 
         for sumo_actor_id in sumo_spawned_actors:
@@ -164,17 +172,20 @@ class CoScenarioManager(ScenarioManager):
             if sumo_actor_id in self.sumo2carla_ids:
                 self.destroy_actor(self.sumo2carla_ids.pop(sumo_actor_id))
 
-        # Updating sumo actors in carla.
-        for sumo_actor_id in self.sumo2carla_ids:
-            carla_actor_id = self.sumo2carla_ids[sumo_actor_id]
-
-            sumo_actor = self.sumo.get_actor(sumo_actor_id)
+        # Updating sumo actors in carla. All the transforms are sent
+        # to the server in a single batch instead of one rpc per vehicle.
+        batch = []
+        sumo_actors = self.sumo.get_all_actors(self.sumo2carla_ids)
+        for sumo_actor_id, carla_actor_id in self.sumo2carla_ids.items():
+            sumo_actor = sumo_actors[sumo_actor_id]
 
             carla_transform = \
                 BridgeHelper.get_carla_transform(sumo_actor.transform,
                                                  sumo_actor.extent)
-            assert self.synchronize_vehicle(carla_actor_id,
-                                            carla_transform)
+            batch.append(carla.command.ApplyTransform(carla_actor_id,
+                                                      carla_transform))
+        if batch:
+            self.client.apply_batch(batch)
 
         # -----------------
         # carla-->sumo sync
@@ -182,16 +193,15 @@ class CoScenarioManager(ScenarioManager):
         self.world.tick()
 
         # Update data structures for the current frame.
-        current_actors = set(
-            [vehicle.id for vehicle in
-             self.world.get_actors().filter('vehicle.*')])
+        current_actors = {vehicle.id for vehicle in
+                          self.world.get_actors().filter('vehicle.*')}
         self.spawned_actors = current_actors.difference(self._active_actors)
         self.destroyed_actors = self._active_actors.difference(current_actors)
         self._active_actors = current_actors
 
         # Spawning new carla actors (not controlled by sumo). For example,
         # the CAV we created on the carla side.
-        carla_spawned_actors = self.spawned_actors - set(
+        carla_spawned_actors = self.spawned_actors.difference(
             self.sumo2carla_ids.values())
         for carla_actor_id in carla_spawned_actors:
             carla_actor = self.world.get_actor(carla_actor_id)
@@ -216,7 +226,6 @@ class CoScenarioManager(ScenarioManager):
             sumo_actor_id = self.carla2sumo_ids[carla_actor_id]
 
             carla_actor = self.world.get_actor(carla_actor_id)
-            sumo_actor = self.sumo.get_actor(sumo_actor_id)
             sumo_transform = \
                 BridgeHelper.get_sumo_transform(carla_actor.get_transform(),
                                             carla_actor.bounding_box.extent)
@@ -225,10 +234,14 @@ class CoScenarioManager(ScenarioManager):
 
         # Updates traffic lights in sumo based on carla information.
         # todo make sure the tl is synced
-        common_landmarks = self.sumo.traffic_light_ids & \
-                           self.traffic_light_ids
-        for landmark_id in common_landmarks:
-            carla_tl_state = self.get_traffic_light_state(landmark_id)
+        for landmark_id, traffic_light in self._common_tls:
+            carla_tl_state = traffic_light.state
+            # phases change every few seconds while we tick much faster,
+            # so only the landmarks that changed need to be sent to sumo.
+            if self._tl_states.get(landmark_id) == carla_tl_state:
+                continue
+            self._tl_states[landmark_id] = carla_tl_state
+
             sumo_tl_state = BridgeHelper.get_sumo_traffic_light_state(
                 carla_tl_state)
 
@@ -285,31 +298,6 @@ class CoScenarioManager(ScenarioManager):
 
         return response.actor_id
 
-    def synchronize_vehicle(self, vehicle_id, transform):
-        """
-        The key function of co-simulation. Given the updated location in sumo,
-        carla will move the corresponding vehicle to the same location.
-
-        Parameters
-        ----------
-        vehicle_id : int
-            The id of the carla actor to be updated.
-
-        transform : carla.Transform
-            The new vehicle transform.
-
-        Returns
-        -------
-        success : bool
-            Whether update is successful.
-        """
-        vehicle = self.world.get_actor(vehicle_id)
-        if vehicle is None:
-            return False
-
-        vehicle.set_transform(transform)
-        return True
-
     def destroy_actor(self, actor_id):
         """
         Destroys the given carla actor.
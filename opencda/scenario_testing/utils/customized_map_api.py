@@ -6,7 +6,6 @@
 # License: TDG-Attribution-NonCommercial-NoDistrib
 
 import os
-import sys
 
 import carla
 
@@ -39,9 +38,8 @@ def load_customized_world(xodr_path, client):
         with open(xodr_path) as od_file:
             try:
                 data = od_file.read()
-            except OSError:
-                print('file could not be readed.')
-                sys.exit()
+            except OSError as e:
+                raise OSError('file %s could not be read.' % xodr_path) from e
         print('load opendrive map %r.' % os.path.basename(xodr_path))
         vertex_distance = 2.0  # in meters
         max_road_length = 500.0  # in meters
@@ -51,6 +51,7 @@ def run_scenario(opt, scenario_params):
                               current_time=scenario_params['current_time'])
 
         spectator = scenario_manager.world.get_spectator()
+        show_spectator = getattr(opt, 'show_spectator', True)
 
         # save the data collection protocol to the folder
         current_path = os.path.dirname(os.path.realpath(__file__))
@@ -62,16 +63,17 @@ def run_scenario(opt, scenario_params):
 
         while True:
             scenario_manager.tick()
-            transform = single_cav_list[0].vehicle.get_transform()
-            spectator.set_transform(carla.Transform(
-                transform.location +
-                carla.Location(
-                    z=70),
-                carla.Rotation(
-                    pitch=-
-                    90)))
-
-            for i, single_cav in enumerate(single_cav_list):
+            if show_spectator:
+                transform = single_cav_list[0].vehicle.get_transform()
+                spectator.set_transform(carla.Transform(
+                    transform.location +
+                    carla.Location(
+                        z=70),
+                    carla.Rotation(
+                        pitch=-
+                        90)))
+
+            for single_cav in single_cav_list:
                 single_cav.update_info()
                 control = single_cav.run_step()
                 single_cav.vehicle.apply_control(control)
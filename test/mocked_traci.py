@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Mock traci for unit tests.
+"""
+
+# License: MIT
+
+
+class TraCIException(Exception):
+    """ A mock class for TraCIException. """
+
+
+class constants(object):
+    """ A mock class for the traci constants used by the sumo bridge. """
+    TL_CURRENT_PROGRAM = 0x29
+    TL_CURRENT_PHASE = 0x28
+
+    VAR_TYPE = 0x4f
+    VAR_VEHICLECLASS = 0x49
+    VAR_COLOR = 0x45
+    VAR_LENGTH = 0x44
+    VAR_WIDTH = 0x4d
+    VAR_HEIGHT = 0xbc
+    VAR_POSITION3D = 0x39
+    VAR_ANGLE = 0x43
+    VAR_SLOPE = 0x36
+    VAR_SPEED = 0x40
+    VAR_SPEED_LAT = 0x32
+    VAR_SIGNALS = 0x5b
+    VAR_DEPARTED_VEHICLES_IDS = 0x74
+    VAR_ARRIVED_VEHICLES_IDS = 0x7a
+
+
+class Phase(object):
+    """ A mock class for a traffic light phase. """
+
+    def __init__(self, state):
+        self.state = state
+
+
+class Logic(object):
+    """ A mock class for a traffic light program logic. """
+
+    def __init__(self, program_id, states, parameters):
+        self.programID = program_id
+        self.phases = [Phase(state) for state in states]
+        self.parameters = parameters
+
+    def getPhases(self):
+        return self.phases
+
+    def getParameters(self):
+        return self.parameters
+
+
+class trafficlight(object):
+    """
+    A mock class for the traci traffic light domain. Tests fill in the
+    class attributes to describe the network and the subscription results.
+    """
+    logics = {}  # {tlid: [Logic]}
+    programs = {}  # {tlid: program_id}
+    subscription_results = {}  # {tlid: {variable: value}}
+    rgy_states = []  # [(tlid, state)] sent through setRedYellowGreenState
+    link_states = []  # [(tlid, link_index, state)] sent through setLinkState
+
+    @classmethod
+    def getIDList(cls):
+        return list(cls.logics.keys())
+
+    @classmethod
+    def getAllProgramLogics(cls, tlid):
+        return cls.logics[tlid]
+
+    @classmethod
+    def getProgram(cls, tlid):
+        return cls.programs[tlid]
+
+    @staticmethod
+    def getPhase(tlid):
+        return 0
+
+    @staticmethod
+    def subscribe(tlid, variables):
+        pass
+
+    @staticmethod
+    def unsubscribe(tlid):
+        pass
+
+    @classmethod
+    def getAllSubscriptionResults(cls):
+        return cls.subscription_results
+
+    @classmethod
+    def setRedYellowGreenState(cls, tlid, state):
+        cls.rgy_states.append((tlid, state))
+
+    @classmethod
+    def setLinkState(cls, tlid, link_index, state):
+        cls.link_states.append((tlid, link_index, state))
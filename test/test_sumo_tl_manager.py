@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the sumo traffic light manager.
+"""
+# License: MIT
+
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+# temporary solution for relative imports in case opencda is not installed
+# if opencda is installed, no need to use the following line
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+import mocked_carla as mcarla
+import mocked_traci as mtraci
+
+# the sumo bridge talks to sumo through traci, which is replaced by the mock.
+# The stubs are only installed while this module runs.
+_modules_patcher = mock.patch.dict(sys.modules, {'traci': mtraci})
+sumo_simulation = None
+
+
+def _stub_missing(stubs, name, module):
+    try:
+        __import__(name)
+    except ImportError:
+        stubs[name] = module
+
+
+def setUpModule():
+    global sumo_simulation
+
+    stubs = {}
+    _stub_missing(stubs, 'carla', mcarla)
+    _stub_missing(stubs, 'sumolib', types.ModuleType('sumolib'))
+    _stub_missing(stubs, 'lxml.etree', types.ModuleType('lxml.etree'))
+    if 'lxml.etree' in stubs:
+        stubs['lxml'] = types.ModuleType('lxml')
+        stubs['lxml'].etree = stubs['lxml.etree']
+
+    _modules_patcher.start()
+    sys.modules.update(stubs)
+    # the bridge binds traci at import time, so it is imported under the stubs
+    # and dropped again by the patcher
+    sys.modules.pop(
+        'opencda.co_simulation.sumo_integration.sumo_simulation', None)
+    from opencda.co_simulation.sumo_integration import \
+        sumo_simulation as module
+    sumo_simulation = module
+
+
+def tearDownModule():
+    _modules_patcher.stop()
+
+
+TL_PROGRAM = mtraci.constants.TL_CURRENT_PROGRAM
+TL_PHASE = mtraci.constants.TL_CURRENT_PHASE
+
+
+class TestSumoTLManager(unittest.TestCase):
+    def setUp(self):
+        mtraci.trafficlight.logics = {
+            'J1': [
+                mtraci.Logic('0', ['GGr', 'yyr'],
+                             {'linkSignalID:0': '100',
+                              'linkSignalID:1': '100',
+                              'linkSignalID:2': '101'}),
+                mtraci.Logic('1', ['rGG', 'ryy'],
+                             {'linkSignalID:0': '200',
+                              'linkSignalID:1': '100'})]}
+        mtraci.trafficlight.programs = {'J1': '0'}
+        mtraci.trafficlight.subscription_results = {}
+        mtraci.trafficlight.rgy_states = []
+        mtraci.trafficlight.link_states = []
+        self.tl_manager = sumo_simulation.SumoTLManager()
+
+    def tick(self, program, phase=0):
+        mtraci.trafficlight.subscription_results = {
+            'J1': {TL_PROGRAM: program, TL_PHASE: phase}}
+        self.tl_manager.tick()
+
+    def test_cached_results_are_immutable(self):
+        signals = self.tl_manager.get_all_associated_signals('100')
+        assert isinstance(signals, frozenset)
+        assert signals is self.tl_manager.get_all_associated_signals('100')
+
+    def test_program_change_refreshes_cache(self):
+        assert self.tl_manager.get_all_landmarks() == {'100', '101'}
+        assert self.tl_manager.get_all_associated_signals('100') == \
+            {('J1', 0), ('J1', 1)}
+
+        # same program, only the phase changes
+        self.tick('0', 1)
+        assert self.tl_manager.get_all_landmarks() == {'100', '101'}
+
+        self.tick('1')
+        assert self.tl_manager.get_all_landmarks() == {'100', '200'}
+        assert self.tl_manager.get_all_associated_signals('100') == \
+            {('J1', 1)}
+        assert self.tl_manager.get_all_associated_signals('101') == set()
+
+    def test_online_results_are_skipped(self):
+        self.tick('0', 1)
+        self.tick('online', 0)
+        assert self.tl_manager.get_all_landmarks() == {'100', '101'}
+
+    def test_switch_off(self):
+        self.tl_manager.switch_off()
+        assert mtraci.trafficlight.rgy_states == [('J1', 'OOO')]
+
+    def test_set_state_uses_cached_signals(self):
+        self.tl_manager.get_all_associated_signals('100')
+        self.tl_manager.set_state('100', 'G')
+        assert sorted(mtraci.trafficlight.link_states) == \
+            [('J1', 0, 'G'), ('J1', 1, 'G')]
+
+
+if __name__ == '__main__':
+    unittest.main()